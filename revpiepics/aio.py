@@ -25,37 +25,111 @@ RevPiEpics.builder : High-level automatic builder method
 
 from softioc import builder
 
+import functools
 import logging
 from .recod import RecordDirection, RecordType
 from .iomap import IOMap, AnalogIOMap
+from .revpiepics import RevPiEpics
 from .utils import status_bit_length, record_write, get_io_offset_value
 
 from revpimodio2.pictory import ProductType, AIO
 from revpimodio2.io import IntIO
 
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 # ---------------------------------------------------------------------------
 # Offset definitions — See the Revolution Pi documentation for the meaning
 # of each address in an AIO module.
 # ---------------------------------------------------------------------------
 # Analog input channels
-ANALOG_INPUT_OFFSETS = [0, 2, 4, 6]
+ANALOG_INPUT_OFFSETS = frozenset({0, 2, 4, 6})
 
 # Status registers for analog inputs
-ANALOG_INPUT_STATUS_OFFSETS = [8, 9, 10, 11]
+ANALOG_INPUT_STATUS_OFFSETS = frozenset({8, 9, 10, 11})
 
 # Temperature input channels
-TEMPERATURE_INPUT_OFFSETS = [12, 14]
+TEMPERATURE_INPUT_OFFSETS = frozenset({12, 14})
 
 # Status registers for temperature inputs
-TEMPERATURE_INPUT_STATUS_OFFSETS = [16, 17]
+TEMPERATURE_INPUT_STATUS_OFFSETS = frozenset({16, 17})
 
 # Status registers for analog outputs
-ANALOG_OUTPUT_STATUS_OFFSETS = [18, 19]
+ANALOG_OUTPUT_STATUS_OFFSETS = frozenset({18, 19})
 
 # Analog output channels
-ANALOG_OUTPUT_OFFSETS = [20, 22]
+ANALOG_OUTPUT_OFFSETS = frozenset({20, 22})
+
+# Channels carrying a value scaled by the module (multiplier / divisor / offset)
+_SCALED_OFFSETS = ANALOG_INPUT_OFFSETS | TEMPERATURE_INPUT_OFFSETS | ANALOG_OUTPUT_OFFSETS
+
+# mbbi state labels, in bit-length order, for each status register kind
+_AI_STATUS_LABELS = (
+    "OK",
+    ("Below the range", "MAJOR"),
+    ("Above the range", "MAJOR"),
+)
+
+_TEMP_STATUS_LABELS = (
+    "OK",
+    ("T<-200°C / short circuit", "MAJOR"),
+    ("T>850°C / not connected", "MAJOR"),
+)
+
+_AO_STATUS_LABELS = (
+    "OK",
+    ("Temperature error", "MAJOR"),
+    ("Open load", "MAJOR"),
+    ("Internal error", "MAJOR"),
+    ("Range error", "MAJOR"),
+    ("Internal purposes", "MAJOR"),
+    ("Supply voltage < 10.2V", "MAJOR"),
+    ("Supply voltage > 28.8V", "MAJOR"),
+    ("Connection timeout", "MAJOR"),
+)
+
+# Output range code → (min, max) in mV for voltage outputs or µA for current outputs
+_OUTPUT_RANGES = {
+    AIO.OUT_RANGE_OFF: (None, None),
+    # Voltage output ranges (in millivolts)
+    AIO.OUT_RANGE_0_5V: (0, 5000),
+    AIO.OUT_RANGE_0_10V: (0, 10000),
+    AIO.OUT_RANGE_N5_5V: (-5000, 5000),
+    AIO.OUT_RANGE_N10_10V: (-10000, 10000),
+    AIO.OUT_RANGE_0_5P5V: (0, 5500),
+    AIO.OUT_RANGE_0_11V: (0, 11000),
+    AIO.OUT_RANGE_N5P5_5P5V: (-5500, 5500),
+    AIO.OUT_RANGE_N11_11V: (-11000, 11000),
+    # Current output ranges (in microamps)
+    AIO.OUT_RANGE_4_20MA: (4000, 20000),
+    AIO.OUT_RANGE_0_20MA: (0, 20000),
+    AIO.OUT_RANGE_0_24MA: (0, 24000),
+}
+
+# Same limits as a tuple indexed directly by the (small, non-negative) range code
+_OUTPUT_RANGE_TABLE = tuple(
+    _OUTPUT_RANGES.get(code, (None, None)) for code in range(max(_OUTPUT_RANGES) + 1)
+)
+
+# Analog output data offset → parameter addresses (range, multiplier, divisor, offset)
+# as defined in the Revolution Pi AIO documentation
+_AO_PARAM_ADDRS = {
+    20: (69, 73, 75, 77),  # Channel 1
+    22: (79, 83, 85, 87),  # Channel 2
+}
+
+# Analog input data offset → parameter addresses (multiplier, divisor, offset)
+_AI_PARAM_ADDRS = {
+    0: (25, 27, 29),  # Channel 1
+    2: (32, 34, 36),  # Channel 2
+    4: (39, 41, 43),  # Channel 3
+    6: (46, 48, 50),  # Channel 4
+}
+
+# Temperature input data offset → parameter addresses (multiplier, divisor, offset)
+_TEMP_PARAM_ADDRS = {
+    12: (55, 57, 59),  # RTD 1
+    14: (63, 65, 67),  # RTD 2
+}
 
 logger = logging.getLogger(__name__)
 
@@ -95,9 +169,58 @@ def builder_aio(
     RecordWrapper | None
         The created record, or *None* if an error occurred.
     """
-    # Calculate the relative offset within the AIO module
-    parent_offset = io_point._parentdevice._offset
-    offset = io_point.address - parent_offset
+    return builder_aio_batch(
+        [io_name], [io_point], [pv_name], DRVL=DRVL, DRVH=DRVH, **fields
+    )[0]
+
+
+def builder_aio_batch(
+    io_names: List[str],
+    io_points: List[IntIO],
+    pv_names: List[str],
+    DRVL=None,
+    DRVH=None,
+    **fields,
+) -> List[Optional[IOMap]]:
+    """
+    Create the EPICS records bound to several AIO points in a single pass.
+
+    The scaling options are extracted once for the whole batch, and the
+    AIO configuration registers of each module are read once (see
+    `_read_analog_out_params`), whatever the number of points built.
+
+    Parameters
+    ----------
+    io_names : list of str
+        Names of the RevPi IO points.
+    io_points : list of IntIO
+        The IO objects returned by *revpimodio2*, in the same order.
+    pv_names : list of str
+        The EPICS process variable names to create, in the same order.
+    DRVL / DRVH : int | float | str | None
+        Display limits forwarded to *builder.aOut()*, if applicable.
+    **fields : dict
+        Additional keyword arguments passed to *softioc.builder* for every record.
+
+    Returns
+    -------
+    list of IOMap | None
+        One mapping per IO point, or *None* where creation failed.
+
+    Raises
+    ------
+    ValueError
+        If the three input lists do not have the same length.
+    """
+    # Validate before creating any record, a mismatch must leave the database untouched
+    if not len(io_names) == len(io_points) == len(pv_names):
+        raise ValueError(
+            f"io_names, io_points and pv_names must have the same length "
+            f"({len(io_names)}, {len(io_points)}, {len(pv_names)})"
+        )
+
+    io_label = ", ".join(io_names)
+
     # Extract custom scaling autosave fields, removing them from generic **fields
     autosave_params = fields.pop('autosave_params', False)
     autosave_offset = fields.pop('autosave_offset', autosave_params)
@@ -109,7 +232,7 @@ def builder_aio(
         try:
             initial_multiplier_override = float(initial_multiplier_override)
         except (ValueError, TypeError):
-            logger.error(f"Invalid initial_multiplier '{initial_multiplier_override}' for '{io_name}', must be numeric. Ignoring.")
+            logger.error("Invalid initial_multiplier '%s' for '%s', must be numeric. Ignoring.", initial_multiplier_override, io_label)
             initial_multiplier_override = None
 
     initial_offset_override = fields.pop('initial_offset', None)
@@ -117,143 +240,65 @@ def builder_aio(
         try:
             initial_offset_override = float(initial_offset_override)
         except (ValueError, TypeError):
-            logger.error(f"Invalid initial_offset '{initial_offset_override}' for '{io_name}', must be numeric. Ignoring.")
+            logger.error("Invalid initial_offset '%s' for '%s', must be numeric. Ignoring.", initial_offset_override, io_label)
             initial_offset_override = None
-    
-    # Initialize variables to track the created record and its properties
-    record = None
-    record_direction = None
-    record_type = None
-
-    # ------------------------------------------------------------------
-    # Analog inputs
-    # ------------------------------------------------------------------
-    if offset in ANALOG_INPUT_OFFSETS:
-        # Create analog input record with current IO value as initial value
-        record = builder.aIn(pv_name, initial_value=io_point.value, **fields)
-        record_direction = RecordDirection.INPUT
-        record_type = RecordType.ANALOG
-
-    elif offset in ANALOG_INPUT_STATUS_OFFSETS:
-        # Create mbbi record for analog input status
-        record = builder.mbbIn(
-            pv_name,
-            "OK",
-            ("Below the range", "MAJOR"),
-            ("Above the range", "MAJOR"),
-            initial_value=status_bit_length(io_point.value),
-            **fields
-        )
-        record_direction = RecordDirection.INPUT
-        record_type = RecordType.STATUS
-
-    # ------------------------------------------------------------------
-    # Temperature inputs
-    # ------------------------------------------------------------------
-    elif offset in TEMPERATURE_INPUT_OFFSETS:
-        # Create analog input record for temperature measurement
-        record = builder.aIn(pv_name, initial_value=io_point.value, **fields)
-        record_direction = RecordDirection.INPUT
-        record_type = RecordType.ANALOG
-
-    elif offset in TEMPERATURE_INPUT_STATUS_OFFSETS:
-        # Create mbbi record for temperature input status
-        record = builder.mbbIn(
-            pv_name,
-            "OK",
-            ("T<-200°C / short circuit", "MAJOR"),
-            ("T>850°C / not connected", "MAJOR"),
-            initial_value=status_bit_length(io_point.value),
-            **fields
-        )
-        record_direction = RecordDirection.INPUT
-        record_type = RecordType.STATUS
-
-    # ------------------------------------------------------------------
-    # Analog outputs
-    # ------------------------------------------------------------------
-    elif offset in ANALOG_OUTPUT_STATUS_OFFSETS:
-        # Create mbbi record for analog output status
-        record = builder.mbbIn(
-            pv_name,
-            "OK",
-            ("Temperature error", "MAJOR"),
-            ("Open load", "MAJOR"),
-            ("Internal error", "MAJOR"),
-            ("Range error", "MAJOR"),
-            ("Internal purposes", "MAJOR"),
-            ("Supply voltage < 10.2V", "MAJOR"),
-            ("Supply voltage > 28.8V", "MAJOR"),
-            ("Connection timeout", "MAJOR"),
-            initial_value=status_bit_length(io_point.value),
-            **fields
-        )
-        record_direction = RecordDirection.INPUT
-        record_type = RecordType.STATUS
 
-    elif offset in ANALOG_OUTPUT_OFFSETS:
-        # Create analog output record with proper scaling and range validation
-        from .revpiepics import RevPiEpics
-        revpi = RevPiEpics.get_mod_io()
+    mappings = []
+    parent_device = parent_offset = None
+    for io_name, io_point, pv_name in zip(io_names, io_points, pv_names):
+        # Resolve the module base offset once per run of points on the same device
+        if io_point._parentdevice is not parent_device:
+            parent_device = io_point._parentdevice
+            parent_offset = parent_device._offset
+
+        # Calculate the relative offset within the AIO module
+        offset = io_point.address - parent_offset
+        mappings.append(_build_mapping(
+            io_name, io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields,
+            autosave_multiplier=autosave_multiplier,
+            autosave_offset=autosave_offset,
+            initial_multiplier_override=initial_multiplier_override,
+            initial_offset_override=initial_offset_override,
+        ))
+    return mappings
+
+
+def _build_mapping(
+    io_name: str,
+    io_point: IntIO,
+    pv_name: str,
+    offset: int,
+    parent_offset: int,
+    DRVL,
+    DRVH,
+    fields: dict,
+    *,
+    autosave_multiplier: bool,
+    autosave_offset: bool,
+    initial_multiplier_override: Optional[float],
+    initial_offset_override: Optional[float],
+) -> Optional[IOMap]:
+    """
+    Create the record and its IO mapping for a single AIO point.
+
+    Returns *None* if the offset is not supported or the record could not be created.
+    """
+    # Dispatch to the record constructor registered for this offset
+    meta = _OFFSET_META.get(offset)
+    if meta is None:
+        # Odd bytes of 16-bit values, RTD settings, configuration registers...
+        logger.error("Unsupported AIO offset %d for '%s'", offset, io_name)
+        return None
+    handler, record_direction, record_type = meta
+    record = handler(io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields)
 
-        if not revpi or not revpi.io:
-            logger.error("Cannot access RevPi IOs for analog output processing.")
-        else:
-            # Read output configuration parameters from the device
-            out_range, out_multiplier, out_divisor, out_offset = _read_analog_out_params(offset, parent_offset)
-
-            # Validate that the output channel is properly configured
-            if out_range is not None and out_range > 0:
-                # Get the physical range limits based on the configured output type
-                range_min, range_max = _output_range(out_range)
-
-                # Ensure all parameters are valid integers for calculation
-                if (
-                    isinstance(range_min, int) and
-                    isinstance(range_max, int) and
-                    isinstance(out_multiplier, int) and
-                    isinstance(out_divisor, int) and
-                    out_divisor != 0 and
-                    isinstance(out_offset, int)
-                ):
-                    # Calculate engineering unit limits from raw ADC values
-                    # Apply user-defined limits if provided, otherwise use calculated limits
-                    try:
-                        value_min = float(DRVL) if DRVL is not None else ((range_min * out_multiplier) / out_divisor) + out_offset
-                    except (TypeError, ValueError):
-                        value_min = ((range_min * out_multiplier) / out_divisor) + out_offset
-
-                    try:
-                        value_max = float(DRVH) if DRVH is not None else ((range_max * out_multiplier) / out_divisor) + out_offset
-                    except (TypeError, ValueError):
-                        value_max = ((range_max * out_multiplier) / out_divisor) + out_offset
-
-                    # Create analog output record with proper limits and write callback
-                    record = builder.aOut(
-                        pv_name,
-                        initial_value=io_point.value,
-                        on_update_name=record_write,  # Callback for writing to hardware
-                        DRVH=value_max,               # High operating range
-                        DRVL=value_min,               # Low operating range
-                        **fields
-                    )
-                    record_direction = RecordDirection.OUTPUT
-                    record_type = RecordType.ANALOG
-                else:
-                    logger.error("Incomplete conversion parameters for analog output '%s'", io_point.name)
-            else:
-                logger.error("Analog output '%s' is disabled or has invalid parameters", io_point.name)
-    
     # Create and return the IO mapping if record creation was successful
-    if record and record_direction and record_type: 
-        from .revpiepics import RevPiEpics
-        revpi = RevPiEpics.get_mod_io()
-
+    if record: 
         is_aio_analog = False
         hw_m, hw_d, hw_o = 1.0, 1.0, 0.0
         pv_m, pv_o = None, None
         
-        if offset in ANALOG_INPUT_OFFSETS + TEMPERATURE_INPUT_OFFSETS + ANALOG_OUTPUT_OFFSETS:
+        if offset in _SCALED_OFFSETS:
             is_aio_analog = True
             
             # Extract parameters based on input/output type
@@ -294,12 +339,7 @@ def builder_aio(
         # Construct primary mapping
         if is_aio_analog:
             main_mapping = AnalogIOMap(
-                io_name=io_name,
-                pv_name=pv_name,
-                io_point=io_point,
-                record=record,
-                direction=record_direction,
-                record_type=record_type,
+                io_name, pv_name, io_point, record, record_direction, record_type,
                 hw_multiplier=hw_m,
                 hw_divisor=hw_d,
                 hw_offset=hw_o,
@@ -308,12 +348,7 @@ def builder_aio(
             )
         else:
             main_mapping = IOMap(
-                io_name=io_name,
-                pv_name=pv_name,
-                io_point=io_point,
-                record=record,
-                direction=record_direction,
-                record_type=record_type
+                io_name, pv_name, io_point, record, record_direction, record_type
             )
         
         # Return the generated mapping
@@ -322,6 +357,106 @@ def builder_aio(
         return None
 
 
+# ---------------------------------------------------------------------------
+# Record constructors — one per offset group, selected through _OFFSET_META.
+# Each returns the created record, or None when it could not be created.
+# ---------------------------------------------------------------------------
+def _build_analog_input(io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields):
+    """Create an analog input record (`ai`) with the current IO value as initial value."""
+    return builder.aIn(pv_name, initial_value=io_point.value, **fields)
+
+
+def _build_analog_input_status(io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields):
+    """Create an `mbbi` record for an analog input status register."""
+    return builder.mbbIn(
+        pv_name,
+        *_AI_STATUS_LABELS,
+        initial_value=status_bit_length(io_point.value),
+        **fields
+    )
+
+
+def _build_temperature_input_status(io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields):
+    """Create an `mbbi` record for a temperature input status register."""
+    return builder.mbbIn(
+        pv_name,
+        *_TEMP_STATUS_LABELS,
+        initial_value=status_bit_length(io_point.value),
+        **fields
+    )
+
+
+def _build_analog_output_status(io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields):
+    """Create an `mbbi` record for an analog output status register."""
+    return builder.mbbIn(
+        pv_name,
+        *_AO_STATUS_LABELS,
+        initial_value=status_bit_length(io_point.value),
+        **fields
+    )
+
+
+def _build_analog_output(io_point, pv_name, offset, parent_offset, DRVL, DRVH, fields):
+    """Create an analog output record (`ao`) with proper scaling and range validation."""
+    revpi = RevPiEpics.get_mod_io()
+
+    if not revpi or not revpi.io:
+        logger.error("Cannot access RevPi IOs for analog output processing.")
+        return None
+
+    # Read output configuration parameters from the device
+    out_range, out_multiplier, out_divisor, out_offset = _read_analog_out_params(offset, parent_offset)
+
+    # Validate that the output channel is properly configured
+    if out_range is None or out_range <= 0:
+        logger.error("Analog output '%s' is disabled or has invalid parameters", io_point.name)
+        return None
+
+    # Calculate engineering unit limits from the configured output range;
+    # missing registers (None) or a zero divisor make the arithmetic fail
+    try:
+        limits = _compute_drv_limits(out_range, out_multiplier, out_divisor, out_offset)
+    except (TypeError, ZeroDivisionError):
+        limits = None
+    if limits is None:
+        logger.error("Incomplete conversion parameters for analog output '%s'", io_point.name)
+        return None
+    default_min, default_max = limits
+
+    # Apply user-defined limits if provided, otherwise use calculated limits
+    value_min = _coerce_limit(DRVL, default_min)
+    value_max = _coerce_limit(DRVH, default_max)
+
+    # Create analog output record with proper limits and write callback
+    record = builder.aOut(
+        pv_name,
+        initial_value=io_point.value,
+        on_update_name=record_write,  # Callback for writing to hardware
+        DRVH=value_max,               # High operating range
+        DRVL=value_min,               # Low operating range
+        **fields
+    )
+    return record
+
+
+# Offset → (record constructor, direction, record type), resolved with a single
+# lookup in builder_aio()
+_OFFSET_META = {
+    **{o: (_build_analog_input, RecordDirection.INPUT, RecordType.ANALOG)
+       for o in ANALOG_INPUT_OFFSETS},
+    **{o: (_build_analog_input_status, RecordDirection.INPUT, RecordType.STATUS)
+       for o in ANALOG_INPUT_STATUS_OFFSETS},
+    **{o: (_build_analog_input, RecordDirection.INPUT, RecordType.ANALOG)
+       for o in TEMPERATURE_INPUT_OFFSETS},
+    **{o: (_build_temperature_input_status, RecordDirection.INPUT, RecordType.STATUS)
+       for o in TEMPERATURE_INPUT_STATUS_OFFSETS},
+    **{o: (_build_analog_output_status, RecordDirection.INPUT, RecordType.STATUS)
+       for o in ANALOG_OUTPUT_STATUS_OFFSETS},
+    **{o: (_build_analog_output, RecordDirection.OUTPUT, RecordType.ANALOG)
+       for o in ANALOG_OUTPUT_OFFSETS},
+}
+
+
 def _output_range(range: int) -> Tuple[int | None, int | None]:
     """
     Convert an AIO range code into its corresponding engineering unit limits.
@@ -352,38 +487,51 @@ def _output_range(range: int) -> Tuple[int | None, int | None]:
     >>> _output_range(AIO.OUT_RANGE_4_20MA)
     (4000, 20000)  # 4 to 20mA in microamps
     """
-    match range:
-        case AIO.OUT_RANGE_OFF:
-            return None, None
-        # Voltage output ranges (in millivolts)
-        case AIO.OUT_RANGE_0_5V:
-            return 0, 5000
-        case AIO.OUT_RANGE_0_10V:
-            return 0, 10000
-        case AIO.OUT_RANGE_N5_5V:
-            return -5000, 5000
-        case AIO.OUT_RANGE_N10_10V:
-            return -10000, 10000
-        case AIO.OUT_RANGE_0_5P5V:
-            return 0, 5500
-        case AIO.OUT_RANGE_0_11V:
-            return 0, 11000
-        case AIO.OUT_RANGE_N5P5_5P5V:
-            return -5500, 5500
-        case AIO.OUT_RANGE_N11_11V:
-            return -11000, 11000
-        # Current output ranges (in microamps)
-        case AIO.OUT_RANGE_4_20MA:
-            return 4000, 20000
-        case AIO.OUT_RANGE_0_20MA:
-            return 0, 20000
-        case AIO.OUT_RANGE_0_24MA:
-            return 0, 24000
-        case _:
-            # Unknown or unsupported range
-            return None, None
+    if 0 <= range < len(_OUTPUT_RANGE_TABLE):
+        return _OUTPUT_RANGE_TABLE[range]
+    return (None, None)
 
 
+def _coerce_limit(value, default: float) -> float:
+    """
+    Convert a user supplied DRVL/DRVH to float.
+
+    Returns *default* when *value* is None or not numeric.
+    """
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@functools.lru_cache(maxsize=None)
+def _compute_drv_limits(
+    range_code: int, multiplier: int, divisor: int, offset: int
+) -> Optional[Tuple[float, float]]:
+    """
+    Convert an output range code into engineering unit drive limits.
+
+    Channels sharing the same configuration reuse the cached result, so the
+    range lookup and the float arithmetic run once per distinct configuration.
+
+    Returns
+    -------
+    Tuple[float, float] | None
+        The (DRVL, DRVH) pair computed as ``raw * multiplier / divisor + offset``,
+        or None if the range code is disabled or unknown.
+    """
+    range_min, range_max = _output_range(range_code)
+    if range_min is None or range_max is None:
+        return None
+    return (
+        ((range_min * multiplier) / divisor) + offset,
+        ((range_max * multiplier) / divisor) + offset,
+    )
+
+
+@functools.lru_cache(maxsize=None)
 def _read_analog_out_params(offset: int, parent_offset: int) -> Tuple[int | None, int | None, int | None, int | None]:
     """
     Read range and scaling parameters for a given analog output channel.
@@ -401,6 +549,12 @@ def _read_analog_out_params(offset: int, parent_offset: int) -> Tuple[int | None
         The base offset of the AIO module in the global process image.
         Used to calculate absolute addresses for parameter retrieval.
 
+    Notes
+    -----
+    The parameters are device configuration set by PiCtory, so results are
+    cached per (offset, parent_offset). Call `clear_param_cache()` when the
+    RevPi configuration is reloaded.
+
     Returns
     -------
     Tuple[int | None, int | None, int | None, int | None]
@@ -411,79 +565,63 @@ def _read_analog_out_params(offset: int, parent_offset: int) -> Tuple[int | None
         - offset: Zero-point offset for the conversion formula
         Returns (None, None, None, None) if the offset is not recognized.
     """
-    # Mapping of output data offsets to their corresponding parameter addresses
-    # These offsets are defined in the Revolution Pi AIO documentation
-    offset_map = {
-        20: {  # Channel 1 parameter addresses
-            'range': 69,       # Range configuration register
-            'multiplier': 73,  # Multiplier register
-            'divisor': 75,     # Divisor register
-            'offset': 77,      # Offset register
-        },
-        22: {  # Channel 2 parameter addresses
-            'range': 79,       # Range configuration register
-            'multiplier': 83,  # Multiplier register
-            'divisor': 85,     # Divisor register
-            'offset': 87,      # Offset register
-        },
-    }
-
     # Look up the parameter addresses for the given output channel
-    map_entry = offset_map.get(offset)
-    if not map_entry:
+    addrs = _AO_PARAM_ADDRS.get(offset)
+    if addrs is None:
         logger.error("Unknown analog output offset: %s", offset)
         return None, None, None, None
 
     # Read the actual parameter values from the process image
+    range_addr, multiplier_addr, divisor_addr, offset_addr = addrs
     return (
-        get_io_offset_value(parent_offset + map_entry['range']),
-        get_io_offset_value(parent_offset + map_entry['multiplier']),
-        get_io_offset_value(parent_offset + map_entry['divisor']),
-        get_io_offset_value(parent_offset + map_entry['offset']),
+        get_io_offset_value(parent_offset + range_addr),
+        get_io_offset_value(parent_offset + multiplier_addr),
+        get_io_offset_value(parent_offset + divisor_addr),
+        get_io_offset_value(parent_offset + offset_addr),
     )
 
 def _read_analog_in_params(offset: int, parent_offset: int) -> Tuple[int | None, int | None, int | None]:
     """
     Read multiplier, divisor, and offset parameters for a given analog input channel.
     """
-    offset_map = {
-        0: {'multiplier': 25, 'divisor': 27, 'offset': 29},
-        2: {'multiplier': 32, 'divisor': 34, 'offset': 36},
-        4: {'multiplier': 39, 'divisor': 41, 'offset': 43},
-        6: {'multiplier': 46, 'divisor': 48, 'offset': 50},
-    }
-    
-    map_entry = offset_map.get(offset)
-    if not map_entry:
+    addrs = _AI_PARAM_ADDRS.get(offset)
+    if addrs is None:
         logger.error("Unknown analog input offset: %s", offset)
         return None, None, None
 
+    multiplier_addr, divisor_addr, offset_addr = addrs
     return (
-        get_io_offset_value(parent_offset + map_entry['multiplier']),
-        get_io_offset_value(parent_offset + map_entry['divisor']),
-        get_io_offset_value(parent_offset + map_entry['offset']),
+        get_io_offset_value(parent_offset + multiplier_addr),
+        get_io_offset_value(parent_offset + divisor_addr),
+        get_io_offset_value(parent_offset + offset_addr),
     )
 
 def _read_temp_in_params(offset: int, parent_offset: int) -> Tuple[int | None, int | None, int | None]:
     """
     Read multiplier, divisor, and offset parameters for a given temperature input channel.
     """
-    offset_map = {
-        12: {'multiplier': 55, 'divisor': 57, 'offset': 59},
-        14: {'multiplier': 63, 'divisor': 65, 'offset': 67},
-    }
-    
-    map_entry = offset_map.get(offset)
-    if not map_entry:
+    addrs = _TEMP_PARAM_ADDRS.get(offset)
+    if addrs is None:
         logger.error("Unknown temperature input offset: %s", offset)
         return None, None, None
 
+    multiplier_addr, divisor_addr, offset_addr = addrs
     return (
-        get_io_offset_value(parent_offset + map_entry['multiplier']),
-        get_io_offset_value(parent_offset + map_entry['divisor']),
-        get_io_offset_value(parent_offset + map_entry['offset']),
+        get_io_offset_value(parent_offset + multiplier_addr),
+        get_io_offset_value(parent_offset + divisor_addr),
+        get_io_offset_value(parent_offset + offset_addr),
     )
 
+def clear_param_cache() -> None:
+    """
+    Drop the cached AIO configuration parameters.
+
+    Must be called whenever the RevPi configuration may have changed, e.g.
+    when the bridge is stopped before a new `RevPiEpics.init()`.
+    """
+    _read_analog_out_params.cache_clear()
+    _compute_drv_limits.cache_clear()
+
 def _register_builder():
     """
     Register the AIO builder function with the RevPiEpics framework.
@@ -495,7 +633,6 @@ def _register_builder():
     
     This function is called automatically when the module is imported.
     """
-    from .revpiepics import RevPiEpics
     RevPiEpics.register_builder(ProductType.AIO, builder_aio)
 
 # Automatically register the builder when the module is imported
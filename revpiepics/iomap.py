@@ -2,14 +2,22 @@ from dataclasses import dataclass, field
 from revpimodio2.io import IntIO
 from .recod import RecordDirection, RecordType
 import logging
-from typing import Any, Optional, Dict, TYPE_CHECKING
+from typing import Any, Callable, Optional, Dict, List, Tuple, TYPE_CHECKING
 from threading import Lock
 if TYPE_CHECKING:
     from softioc.pythonSoftIoc import RecordWrapper
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Conversion applied to PV values before comparing/writing them to an I/O,
+# selected once per mapping from its record type
+_PV_CASTS: Dict[RecordType, Callable[[Any], Any]] = {
+    RecordType.ANALOG: round,   # Float PV values → integer process image values
+    RecordType.BINARY: int,
+    RecordType.STATUS: int,
+}
+
+@dataclass(slots=True)
 class IOMap:
     """
     Mapping between a RevPi I/O point and an EPICS Process Variable.
@@ -18,6 +26,7 @@ class IOMap:
     I/O hardware with EPICS control system Process Variables (PVs). It handles
     the synchronization of data between the physical I/O and the EPICS database,
     maintaining state information and caching for optimal performance.
+    Instances use `__slots__`, one is created for every built record.
     
     Attributes:
         io_name: Name/identifier of the RevPi I/O point
@@ -32,6 +41,7 @@ class IOMap:
         is_aio_analog: Flag to apply soft computation for AIO
         hw_multiplier: Hardware scaling multiplier read from process image
         pv_multiplier: Pointer to the EPICS Record wrapper managing multiplier
+        pv_cast: Conversion from PV value to I/O value, derived from record_type
     """
     # Core mapping configuration
     io_name: str                   # RevPi I/O point identifier
@@ -45,6 +55,7 @@ class IOMap:
     update_record: bool = False                   # Flag for pending record updates
     last_io_value: Optional[Any] = None           # Cached I/O value for change detection
     last_pv_value: Optional[Any] = None           # Cached PV value for change detection
+    pv_cast: Callable[[Any], Any] = field(default=round, init=False, repr=False)  # PV → I/O value conversion
     
     def __post_init__(self):
         """
@@ -54,10 +65,14 @@ class IOMap:
         to establish baseline for change detection. Handles initialization
         errors gracefully to avoid startup failures.
         """
+        self.pv_cast = _PV_CASTS.get(self.record_type, round)
         try:
             # Initialize cache with current hardware and PV values
             self.last_io_value = self.io_point.value
             self.last_pv_value = self.record.get()
+            if self.direction == RecordDirection.OUTPUT:
+                # Outputs compare PV and I/O on their first feedback pass
+                self.last_io_value = None
         except Exception as e:
             # Log initialization errors but don't fail - values will be updated in sync cycle
             logger.warning("Erreur lors de l'initialisation du cache pour %s: %s", self.io_name, e)
@@ -80,7 +95,7 @@ class IOMap:
         """
         return self.io_point
 
-@dataclass
+@dataclass(slots=True)
 class AnalogIOMap(IOMap):
     """
     Mapping specialized for Analog I/O points (AIO).
@@ -99,22 +114,25 @@ class AnalogIOMap(IOMap):
     last_pv_offset: Optional[float] = None            # Cached offset for change detection
 
     def __post_init__(self):
-        super().__post_init__()
+        # Explicit base call: zero-argument super() does not work in slotted dataclasses
+        IOMap.__post_init__(self)
         try:
             self.last_pv_multiplier = self.pv_multiplier.get() if self.pv_multiplier else 1.0
             self.last_pv_offset = self.pv_offset.get() if self.pv_offset else 0.0
         except Exception as e:
             logger.warning("Erreur lors de l'initialisation du cache analogique pour %s: %s", self.io_name, e)
 
-@dataclass
+@dataclass(slots=True)
 class DicIOMap:
     """
     Bidirectional dictionary for I/O mappings management.
     
     Provides efficient lookup of IOMap objects by either RevPi I/O name or
-    EPICS PV name. Thread-safe implementation using locks to ensure data
-    consistency in multi-threaded environments. Maintains synchronized
-    dictionaries for fast bidirectional access.
+    EPICS PV name. Writers (add/remove) hold a lock so both dictionaries stay
+    consistent; readers rely on single dict operations being atomic under the
+    GIL and take no lock, except to rebuild a stale direction snapshot once
+    after a change. Maintains synchronized dictionaries for fast
+    bidirectional access.
     
     This class is essential for the synchronization thread to quickly locate
     mappings during the real-time sync cycles without performance overhead.
@@ -124,23 +142,46 @@ class DicIOMap:
     map_io: Dict[str, IOMap] = field(default_factory=dict)    # I/O name -> IOMap lookup
     map_pv: Dict[str, IOMap] = field(default_factory=dict)    # PV name -> IOMap lookup
     
+    # Per-direction mappings, appended on add and rebuilt on remove
+    _input_list: List[IOMap] = field(default_factory=list, init=False)
+    _output_list: List[IOMap] = field(default_factory=list, init=False)
+    # Tuple snapshots of the lists for the sync thread, None once stale
+    _inputs: Optional[Tuple[IOMap, ...]] = field(default=(), init=False)
+    _outputs: Optional[Tuple[IOMap, ...]] = field(default=(), init=False)
+
     # Thread safety for concurrent access
-    _lock: Lock = field(default_factory=Lock, init=False)     # Protects dictionary operations
+    _lock: Lock = field(default_factory=Lock, init=False)     # Serializes add/remove
 
-    def add(self, mapping: IOMap) -> None:
+    def add(self, mapping: IOMap) -> bool:
         """
         Add a new I/O mapping to both dictionaries.
         
         Thread-safe method to add an IOMap to both lookup dictionaries.
-        Ensures consistency between I/O name and PV name mappings.
+        Ensures consistency between I/O name and PV name mappings: the
+        duplicate check and the insertion happen under the same lock, so
+        concurrent callers cannot register the same I/O or PV twice.
         
         Args:
             mapping: IOMap instance to add to the dictionaries
+            
+        Returns:
+            bool: True if the mapping was added, False if its I/O name or
+            PV name is already mapped
         """
         with self._lock:
+            if mapping.io_name in self.map_io or mapping.pv_name in self.map_pv:
+                return False
             # Add to both dictionaries for bidirectional lookup
             self.map_io[mapping.io_name] = mapping
             self.map_pv[mapping.pv_name] = mapping
+            # O(1) per mapping: the snapshot is rebuilt once, on the next read
+            if mapping.direction == RecordDirection.INPUT:
+                self._input_list.append(mapping)
+                self._inputs = None
+            elif mapping.direction == RecordDirection.OUTPUT:
+                self._output_list.append(mapping)
+                self._outputs = None
+            return True
 
     def remove(self, io_name: str) -> bool:
         """
@@ -162,6 +203,7 @@ class DicIOMap:
                 # Remove from both dictionaries to maintain consistency
                 del self.map_io[io_name]
                 del self.map_pv[mapping.pv_name]
+                self._split_by_direction()
                 return True
             return False
 
@@ -169,7 +211,7 @@ class DicIOMap:
         """
         Retrieve a mapping by I/O name.
         
-        Thread-safe lookup of IOMap by RevPi I/O point name.
+        Lock-free lookup of IOMap by RevPi I/O point name.
         Used by synchronization thread to find mappings for I/O updates.
         
         Args:
@@ -178,14 +220,13 @@ class DicIOMap:
         Returns:
             Optional[IOMap]: IOMap if found, None otherwise
         """
-        with self._lock:
-            return self.map_io.get(name)
+        return self.map_io.get(name)
 
     def get_by_pv_name(self, name: str) -> Optional[IOMap]:
         """
         Retrieve a mapping by PV name.
         
-        Thread-safe lookup of IOMap by EPICS Process Variable name.
+        Lock-free lookup of IOMap by EPICS Process Variable name.
         Used when EPICS records are updated to find corresponding I/O mapping.
         
         Args:
@@ -194,20 +235,60 @@ class DicIOMap:
         Returns:
             Optional[IOMap]: IOMap if found, None otherwise
         """
-        with self._lock:
-            return self.map_pv.get(name)
+        return self.map_pv.get(name)
 
     def get_all_mappings(self) -> Dict[str, IOMap]:
         """
         Return a copy of all mappings.
         
-        Thread-safe method to get a snapshot of all current mappings.
+        Lock-free snapshot of all current mappings (`dict.copy` is atomic).
         Returns a copy to prevent external modification of internal state.
         Used by synchronization thread to iterate over all mappings.
         
         Returns:
             Dict[str, IOMap]: Copy of all I/O name -> IOMap mappings
         """
-        with self._lock:
-            # Return copy to prevent external modification
-            return self.map_io.copy()
\ No newline at end of file
+        # Return copy to prevent external modification
+        return self.map_io.copy()
+
+    def get_inputs(self) -> Tuple[IOMap, ...]:
+        """
+        Return all INPUT mappings (RevPi -> PV).
+
+        The tuple is only rebuilt after the mappings changed, so the
+        synchronization thread can fetch it every cycle without copying or
+        branching on the mapping direction.
+
+        Returns:
+            Tuple[IOMap, ...]: Current input mappings
+        """
+        inputs = self._inputs
+        if inputs is None:
+            with self._lock:
+                if self._inputs is None:
+                    self._inputs = tuple(self._input_list)
+                inputs = self._inputs
+        return inputs
+
+    def get_outputs(self) -> Tuple[IOMap, ...]:
+        """
+        Return all OUTPUT mappings (PV -> RevPi).
+
+        Returns:
+            Tuple[IOMap, ...]: Current output mappings
+        """
+        outputs = self._outputs
+        if outputs is None:
+            with self._lock:
+                if self._outputs is None:
+                    self._outputs = tuple(self._output_list)
+                outputs = self._outputs
+        return outputs
+
+    def _split_by_direction(self) -> None:
+        """Rebuild the per-direction lists. Must be called with the lock held."""
+        mappings = self.map_io.values()
+        self._input_list = [m for m in mappings if m.direction == RecordDirection.INPUT]
+        self._output_list = [m for m in mappings if m.direction == RecordDirection.OUTPUT]
+        self._inputs = None
+        self._outputs = None
@@ -1,12 +1,20 @@
 import logging
-from .recod import RecordDirection, RecordType
+import os
+from .recod import RecordType
 from .utils import status_bit_length
 from .iomap import IOMap, AnalogIOMap
-from threading import Event, Thread
-from timeit import default_timer
+from threading import Event, Thread, current_thread
+from typing import Callable, Tuple
+from time import monotonic_ns
 
 logger = logging.getLogger(__name__)
 
+# Record types as module globals: enum class attribute lookups are slower than
+# global loads, and IntEnum members already compare as plain ints
+_ANALOG = RecordType.ANALOG
+_STATUS = RecordType.STATUS
+_BINARY = RecordType.BINARY
+
 class PVSyncThread(Thread):
     """
     Synchronization thread between RevPi and EPICS.
@@ -31,11 +39,21 @@ class PVSyncThread(Thread):
         self._revpi = bridge_cls._revpi
         self._dictmap = bridge_cls._dictmap
         self._cycle_time_ms = bridge_cls._cycle_time_ms
-        self._custom_functions = bridge_cls._custom_functions
-        self._custom_functions_lock = bridge_cls._custom_functions_lock
+        self._cycle_time_ns = int(self._cycle_time_ms * 1_000_000)  # Integer nanoseconds, no drift
         self._cleanup =  bridge_cls._cleanup
+        self._sync_cpu = bridge_cls._sync_cpu
         # Event for graceful thread shutdown
         self._stop_event = Event()
+        # Input synchronization specialized per record type (see _input_jobs)
+        self._input_handlers = {
+            _ANALOG: self._sync_input_analog,
+            _STATUS: self._sync_input_status,
+            _BINARY: self._sync_input_binary,
+        }
+        self._inputs: Tuple[IOMap, ...] = ()
+        self._input_jobs_cache: Tuple[Tuple[Callable[[IOMap], None], IOMap], ...] = ()
+        # Whether per-mapping debug messages are emitted, refreshed every cycle
+        self._debug = False
 
     def run(self) -> None:
         """
@@ -45,12 +63,16 @@ class PVSyncThread(Thread):
         specified cycle time. Handles timing control and error recovery.
         """
         self._stop_event.clear()  # Clear any previous stop signal
+        if self._sync_cpu is not None:
+            self._pin_to_cpu(self._sync_cpu)
         logger.info("Synchronization thread started (cycle: %s ms)", self._cycle_time_ms)
-        cycle_time_s = self._cycle_time_ms / 1000.0  # Convert to seconds for timing
+
+        # Cycles are scheduled on fixed deadlines so that jitter does not accumulate
+        next_deadline = monotonic_ns()
 
         # Main synchronization loop
         while not self._stop_event.is_set():
-            cycle_start = default_timer()  # Record cycle start time
+            cycle_start = monotonic_ns()  # Record cycle start time
 
             try:
                 # Execute one synchronization cycle
@@ -58,23 +80,26 @@ class PVSyncThread(Thread):
 
             except Exception as e:
                 # Critical error handling - stop the bridge on any exception
-                logger.critical(
-                    f"Error: {e}"
-                    f"Stopping synchronization"
-                )
+                logger.critical("Error: %s. Stopping synchronization", e)
                 self._bridge_cls.stop()
                 break
 
-            # Cycle timing management
-            cycle_time = default_timer() - cycle_start
-            cycle_time_ms = cycle_time * 1000
+            # Cycle timing management, re-read so set_cycle_time() applies on the next cycle
+            cycle_time_ns = self._cycle_time_ns
+            now = monotonic_ns()
+            cycle_time = now - cycle_start
+            next_deadline += cycle_time_ns
+
+            # Sleep until the next deadline or warn if cycle time exceeded
+            if cycle_time >= cycle_time_ns:
+                logger.warning("Cycle time exceeded: %.1f ms > %s ms", cycle_time / 1e6, self._cycle_time_ms)
 
-            # Sleep for remaining cycle time or warn if cycle time exceeded
-            if cycle_time < cycle_time_s:
-                sleep_time = cycle_time_s - cycle_time
-                self._stop_event.wait(timeout=sleep_time)
+            sleep_time = next_deadline - now
+            if sleep_time > 0:
+                self._stop_event.wait(timeout=sleep_time / 1e9)
             else:
-                logger.warning(f"Cycle time exceeded: {cycle_time_ms:.1f} ms > {self._cycle_time_ms} ms")
+                # Running late: restart the schedule from now instead of bursting to catch up
+                next_deadline = now
         
         # Perform cleanup if requested
         if self._cleanup:
@@ -82,6 +107,37 @@ class PVSyncThread(Thread):
 
         logger.debug("Synchronization thread stopped")
 
+    def set_cycle_time(self, cycle_time_ms: int) -> None:
+        """
+        Change the cycle time of the running loop.
+        
+        Takes effect from the next cycle. Validation is done by the
+        bridge class.
+        
+        Args:
+            cycle_time_ms: New cycle time in milliseconds
+        """
+        self._cycle_time_ms = cycle_time_ms
+        self._cycle_time_ns = int(cycle_time_ms * 1_000_000)
+
+    def _pin_to_cpu(self, cpu: int) -> None:
+        """
+        Restrict this thread to a single CPU core.
+        
+        The cycle is dominated by process image and record accesses, so
+        staying on one core avoids cache migrations between cycles.
+        Failure is not fatal: the thread keeps running unpinned.
+        
+        Args:
+            cpu: Index of the CPU core to run on
+        """
+        try:
+            # pid 0 targets the calling thread on Linux
+            os.sched_setaffinity(0, {cpu})
+            logger.debug("Synchronization thread pinned to CPU %s", cpu)
+        except (AttributeError, OSError, ValueError) as e:
+            logger.warning("Unable to pin synchronization thread to CPU %s: %s", cpu, e)
+
     def _sync_cycle(self) -> None:
         """
         Execute one synchronization cycle.
@@ -89,46 +145,47 @@ class PVSyncThread(Thread):
         Performs the complete synchronization sequence:
         1. Read RevPi process image (once for the entire cycle)
         2. Synchronize all I/O mappings (both input and output)
-        3. Write RevPi process image
-        4. Execute custom functions (using the same process image)
-        5. Write RevPi process image again (for custom function changes)
+        3. Execute custom functions (using the same process image)
+        4. Write RevPi process image (once, with mapping and custom function changes)
         """
 
         # Read current state from RevPi I/O modules (single read for entire cycle)
         if not self._revpi.readprocimg():
             raise RuntimeError("Failed to read RevPi process image")
 
-        # Get all configured I/O mappings
-        mappings = self._dictmap.get_all_mappings()
+        # Check the log level once per cycle instead of once per changed mapping
+        self._debug = logger.isEnabledFor(logging.DEBUG)
 
-        # Process each mapping according to its direction
-        for mapping in mappings.values():
+        # Handle EPICS -> RevPi direction (control outputs)
+        for mapping in self._dictmap.get_outputs():
             try:
-                if mapping.direction == RecordDirection.OUTPUT:
-                    # Handle EPICS -> RevPi direction (control outputs)
-                    self._sync_output(mapping)
-                elif mapping.direction == RecordDirection.INPUT:
-                    # Handle RevPi -> EPICS direction (read inputs)
-                    self._sync_input(mapping)
-
+                self._sync_output(mapping)
             except Exception as e:
                 # Log individual mapping errors but continue processing others
                 logger.warning("Sync error %s: %s", mapping.io_name, e)
 
-        # Write updated values to RevPi I/O modules after mapping sync
-        if not self._revpi.writeprocimg():
-            raise RuntimeError("Failed to write RevPi process image")
+        # Handle RevPi -> EPICS direction (read inputs)
+        for sync_input, mapping in self._input_jobs():
+            try:
+                sync_input(mapping)
+            except Exception as e:
+                logger.warning("Sync error %s: %s", mapping.io_name, e)
 
         # Execute any registered custom functions (reuses current process image)
         self._execute_custom_functions()
 
+        # Write updated values to RevPi I/O modules (single write for entire cycle)
+        if not self._revpi.writeprocimg():
+            raise RuntimeError("Failed to write RevPi process image")
+
     def _sync_output(self, mapping: IOMap) -> None:
         """
         Synchronize an output mapping (PV -> RevPi).
         
         Handles bidirectional synchronization for output channels:
         - When EPICS PV is updated: PV value -> RevPi output
-        - Otherwise: RevPi output -> PV (feedback for confirmation)
+        - Otherwise: RevPi output -> PV (feedback for confirmation), skipped
+          while the I/O value and scaling parameters are unchanged
         
         Args:
             mapping: IOMap instance containing the mapping configuration
@@ -152,14 +209,18 @@ class PVSyncThread(Thread):
                 if mapping.hw_divisor != 0:
                     pv_value = (raw_adc * mapping.hw_multiplier) / mapping.hw_divisor + mapping.hw_offset
             
-            # Round float values to avoid precision issues
-            pv_value = round(pv_value) if isinstance(pv_value, float) else pv_value
+            # Convert to the I/O value type (rounds analog values)
+            pv_value = mapping.pv_cast(pv_value)
 
             # Only update if value has changed
-            if pv_value != mapping.io_point.value:
-                mapping.io_point.value = pv_value
-                mapping.last_io_value = pv_value
-                logger.debug("OUTPUT: PV %s → IO %s = %s",mapping.pv_name, mapping.io_name, pv_value)
+            io_point = mapping.io_point
+            if pv_value != io_point.value:
+                io_point.value = pv_value
+                if self._debug:
+                    logger.debug("OUTPUT: PV %s → IO %s = %s",mapping.pv_name, mapping.io_name, pv_value)
+
+            # Force a PV/IO comparison on the next feedback pass
+            mapping.last_io_value = None
 
             # Clear update flag
             mapping.update_record = False
@@ -167,13 +228,27 @@ class PVSyncThread(Thread):
         else:
             # Provide feedback - read actual I/O state back to PV
             io_value = mapping.io_point.value
-            pv_value = mapping.record.get()
-            
-            # Apply soft scaling backward for feedback
-            if isinstance(mapping, AnalogIOMap):
+            is_aio_analog = isinstance(mapping, AnalogIOMap)
+
+            if is_aio_analog:
                 pv_m = mapping.pv_multiplier.get() if mapping.pv_multiplier else 1.0
                 pv_o = mapping.pv_offset.get() if mapping.pv_offset else 0.0
-                
+
+                # Optimization: skip the PV read if neither IO value nor scaling params changed
+                if (io_value == mapping.last_io_value and
+                    pv_m == mapping.last_pv_multiplier and
+                    pv_o == mapping.last_pv_offset):
+                    return
+            elif io_value == mapping.last_io_value:
+                # Optimization: skip the PV read if the IO value hasn't changed
+                return
+
+            raw_io_value = io_value
+            record = mapping.record
+            pv_value = record.get()
+            
+            # Apply soft scaling backward for feedback
+            if is_aio_analog:
                 # Back-calculate raw ADC from hardware value
                 if mapping.hw_multiplier != 0:
                     raw_adc = (io_value - mapping.hw_offset) * mapping.hw_divisor / mapping.hw_multiplier
@@ -183,20 +258,27 @@ class PVSyncThread(Thread):
                 # Setup theoretical PV value feedback based on soft setting
                 io_value = (raw_adc * pv_m) + pv_o
             
-            pv_value = round(pv_value) if isinstance(pv_value, float) else pv_value
+            pv_value = mapping.pv_cast(pv_value)
 
             # Update PV if I/O value differs (without processing to avoid loops)
             if pv_value != io_value:
-                mapping.record.set(io_value, process=False)
+                record.set(io_value, process=False)
                 mapping.last_pv_value = io_value
-                logger.debug("OUTPUT: IO %s → PV %s = %s",mapping.io_name, mapping.pv_name, pv_value)
+                if self._debug:
+                    logger.debug("OUTPUT: IO %s → PV %s = %s",mapping.io_name, mapping.pv_name, pv_value)
 
-    def _sync_input(self, mapping: IOMap) -> None:
+            # Update last known values for optimization
+            mapping.last_io_value = raw_io_value
+            if is_aio_analog:
+                mapping.last_pv_multiplier = pv_m
+                mapping.last_pv_offset = pv_o
+
+    def _sync_input_analog(self, mapping: IOMap) -> None:
         """
-        Synchronize an input mapping (RevPi -> PV).
+        Synchronize an ANALOG input mapping (RevPi -> PV).
         
-        Reads RevPi input values and updates corresponding EPICS PVs.
-        Handles different record types (analog, status, binary) appropriately.
+        Transfers the RevPi input value to the EPICS PV, applying soft
+        scaling for AIO analog mappings.
         
         Args:
             mapping: IOMap instance containing the mapping configuration
@@ -204,7 +286,6 @@ class PVSyncThread(Thread):
         io_value = mapping.io_point.value
         is_aio_analog = isinstance(mapping, AnalogIOMap)
 
-        pv_m, pv_o = 1.0, 0.0
         if is_aio_analog:
             pv_m = mapping.pv_multiplier.get() if mapping.pv_multiplier else 1.0
             pv_o = mapping.pv_offset.get() if mapping.pv_offset else 0.0
@@ -214,48 +295,94 @@ class PVSyncThread(Thread):
                 pv_m == mapping.last_pv_multiplier and
                 pv_o == mapping.last_pv_offset):
                 return
+
+            # Back-calculate raw ADC from hardware value
+            if mapping.hw_multiplier != 0:
+                raw_adc = (io_value - mapping.hw_offset) * mapping.hw_divisor / mapping.hw_multiplier
+            else:
+                raw_adc = io_value
+                
+            # Apply EPICS soft constants
+            computed_value = (raw_adc * pv_m) + pv_o
         else:
             # Optimization: skip processing if value hasn't changed
             if io_value == mapping.last_io_value:
                 return
 
-        # Handle different EPICS record types
-        if mapping.record_type == RecordType.ANALOG:
             # Direct analog value transfer
             computed_value = io_value
-            if is_aio_analog:
-                # Back-calculate raw ADC from hardware value
-                if mapping.hw_multiplier != 0:
-                    raw_adc = (io_value - mapping.hw_offset) * mapping.hw_divisor / mapping.hw_multiplier
-                else:
-                    raw_adc = io_value
-                    
-                # Apply EPICS soft constants
-                computed_value = (raw_adc * pv_m) + pv_o
-                
-            if mapping.record.get() != computed_value:
-                mapping.record.set(computed_value)
-                logger.debug("INPUT: IO %s → PV %s = %s", mapping.io_name, mapping.pv_name, computed_value)
 
-        elif mapping.record_type == RecordType.STATUS:
-            # Convert to status bit representation
-            status_value = status_bit_length(io_value)
-            if mapping.record.get() != status_value:
-                mapping.record.set(status_value)
-                logger.debug("STATUS: IO %s → PV %s = %s", mapping.io_name, mapping.pv_name, status_value)
-
-        elif mapping.record_type == RecordType.BINARY:
-            # Convert to boolean for binary records
-            binary_value = bool(io_value)
-            if mapping.record.get() != binary_value:
-                mapping.record.set(binary_value)
-                logger.debug("INPUT: IO %s → PV %s = %s", mapping.io_name, mapping.pv_name, binary_value)
+        record = mapping.record
+        if record.get() != computed_value:
+            record.set(computed_value)
+            if self._debug:
+                logger.debug("INPUT: IO %s → PV %s = %s", mapping.io_name, mapping.pv_name, computed_value)
 
         # Update last known values for optimization
         mapping.last_io_value = io_value
         if is_aio_analog:
             mapping.last_pv_multiplier = pv_m
             mapping.last_pv_offset = pv_o
+
+    def _sync_input_status(self, mapping: IOMap) -> None:
+        """
+        Synchronize a STATUS input mapping (RevPi -> PV).
+        
+        Args:
+            mapping: IOMap instance containing the mapping configuration
+        """
+        io_value = mapping.io_point.value
+        # Optimization: skip processing if value hasn't changed
+        if io_value == mapping.last_io_value:
+            return
+
+        # Convert to status bit representation
+        status_value = status_bit_length(io_value)
+        record = mapping.record
+        if record.get() != status_value:
+            record.set(status_value)
+            if self._debug:
+                logger.debug("STATUS: IO %s → PV %s = %s", mapping.io_name, mapping.pv_name, status_value)
+
+        mapping.last_io_value = io_value
+
+    def _sync_input_binary(self, mapping: IOMap) -> None:
+        """
+        Synchronize a BINARY input mapping (RevPi -> PV).
+        
+        Args:
+            mapping: IOMap instance containing the mapping configuration
+        """
+        io_value = mapping.io_point.value
+        # Optimization: skip processing if value hasn't changed
+        if io_value == mapping.last_io_value:
+            return
+
+        # Convert to boolean for binary records
+        binary_value = bool(io_value)
+        record = mapping.record
+        if record.get() != binary_value:
+            record.set(binary_value)
+            if self._debug:
+                logger.debug("INPUT: IO %s → PV %s = %s", mapping.io_name, mapping.pv_name, binary_value)
+
+        mapping.last_io_value = io_value
+
+    def _input_jobs(self) -> Tuple[Tuple[Callable[[IOMap], None], IOMap], ...]:
+        """
+        Return the (handler, mapping) pairs for all input mappings.
+        
+        The handler is selected once per mapping from its record type, and
+        the pairs are only rebuilt when the set of input mappings changes.
+        """
+        inputs = self._dictmap.get_inputs()
+        if inputs is not self._inputs:
+            handlers = self._input_handlers
+            self._input_jobs_cache = tuple(
+                (handlers[m.record_type], m) for m in inputs if m.record_type in handlers
+            )
+            self._inputs = inputs
+        return self._input_jobs_cache
     
     def _sync_cleanup(self) -> None:
         """
@@ -265,7 +392,7 @@ class PVSyncThread(Thread):
         to their safe default states before the thread terminates.
         """
 
-        logger.debug(f"Reset outputs to initial state")
+        logger.debug("Reset outputs to initial state")
         # Read defaul values process image
         self._revpi.setdefaultvalues()
         # Write the reset values to RevPi I/O
@@ -280,33 +407,29 @@ class PVSyncThread(Thread):
         Custom functions are user-defined callbacks that run during each
         synchronization cycle. They operate on the current process image
         that was read at the beginning of the cycle, avoiding unnecessary
-        I/O operations for better performance.
+        I/O operations for better performance. Their changes are written
+        together with the mapping outputs at the end of the cycle.
         
         Raises:
             RuntimeError: If any custom function fails
         """
-        if not self._custom_functions:
+        # Immutable snapshot maintained by the bridge class, no locking needed
+        functions_to_execute = self._bridge_cls._custom_functions_snapshot
+        if not functions_to_execute:
             return
 
         # Custom functions use the process image already read in _sync_cycle()
         # No additional readprocimg() call needed - performance optimization
 
-        # Get thread-safe copy of functions to execute
-        with self._custom_functions_lock:
-            functions_to_execute = self._custom_functions.items()
-
-        # Execute each custom function
-        for func_name, func in functions_to_execute:
-            try:
+        # Execute each custom function, the first failure aborts the cycle
+        func_name = None
+        try:
+            for func_name, func in functions_to_execute:
                 func()
 
-            except Exception as e:
-                # Re-raise with context about which function failed
-                raise RuntimeError(f"Custom function '{func_name}' failed: {e}")
-
-        # Write I/O image after all custom functions complete
-        if not self._revpi.writeprocimg():
-            raise RuntimeError("Failed to write RevPi process image after custom functions")
+        except Exception as e:
+            # Re-raise with context about which function failed
+            raise RuntimeError(f"Custom function '{func_name}' failed: {e}") from e
 
     def stop(self) -> None:
         """
@@ -317,8 +440,14 @@ class PVSyncThread(Thread):
         """
         # Signal thread to stop
         self._stop_event.set()
-        # Wait for thread completion with timeout
-        self.join(timeout=self._cycle_time_ms*10)
+
+        # Called from the thread itself (bridge stopped after a sync error):
+        # run() exits on its own once this call returns
+        if self is current_thread() or not self.is_alive():
+            return
+
+        # Wait for thread completion with timeout (ten cycles, in seconds)
+        self.join(timeout=self._cycle_time_ms * 10 / 1000.0)
 
         # Warn if thread didn't stop cleanly
         if self.is_alive():
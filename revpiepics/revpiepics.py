@@ -8,14 +8,13 @@ Regular refresh at defined frequency.
 from __future__ import annotations
 
 import atexit
-import functools
 import logging
 from threading import Lock
-from timeit import default_timer
-from typing import Callable, Dict, Optional, cast
+from typing import Callable, Dict, Optional, Tuple, cast
 
 from .pvsync import PVSyncThread
 from .iomap import DicIOMap, IOMap
+from .utils import clear_io_offset_cache
 
 import revpimodio2
 from softioc import builder, pythonSoftIoc, softioc, autosave
@@ -72,6 +71,10 @@ class RevPiEpics:
     _auto_prefix = False
     # Cycle time in milliseconds
     _cycle_time_ms = None
+    # Cycle time used when init() is called with cycletime=None
+    _DEFAULT_CYCLE_TIME_MS = 200
+    # CPU the synchronization thread is pinned to (None: no pinning)
+    _sync_cpu: Optional[int] = None
     # Autosave configuration
     _autosave: bool = False
     _autosave_dir: Optional[str] = None
@@ -79,26 +82,21 @@ class RevPiEpics:
     _autosave_period: float = 30.0
     # PV synchronization thread
     _pv_sync: Optional["PVSyncThread"] = None
+    # Prefix segments (core name, device name) computed once per device
+    _prefix_cache: Dict[str, Tuple[str, ...]] = {}
+    # Console log handler, created on the first init() and reused afterwards
+    _log_handler: Optional[logging.Handler] = None
+    # Whether stop() is already registered as an atexit handler
+    _atexit_registered = False
     # Thread synchronization lock
     _lock = Lock()
     # Custom user functions to execute in sync cycle
     _custom_functions: Dict[str, Callable] = {}
     # Lock for custom functions access
     _custom_functions_lock = Lock()
-
-    @staticmethod
-    def _requires_init(func):
-        """Decorator to check initialization before method execution."""
-
-        @functools.wraps(func)
-        def wrapper(cls, *args, **kwargs):
-            if not cls._initialized:
-                raise RevPiEpicsInitError(
-                    "RevPiEpics not initialized. Call init() first."
-                )
-            return func(cls, *args, **kwargs)
-
-        return wrapper
+    # Immutable (name, function) pairs read lock-free by the sync thread,
+    # replaced under the lock whenever _custom_functions changes
+    _custom_functions_snapshot: Tuple[Tuple[str, Callable], ...] = ()
 
     @classmethod
     def init(
@@ -111,7 +109,8 @@ class RevPiEpics:
             autosave: bool = False,
             autosave_dir: Optional[str] = None,
             autosave_name: str = "revpiepics",
-            autosave_period: float = 30.0
+            autosave_period: float = 30.0,
+            sync_cpu: Optional[int] = None
     ) -> None:
         """Initialize the RevPi-EPICS bridge.
 
@@ -119,7 +118,7 @@ class RevPiEpics:
         Must be called before using any other methods.
 
         Args:
-            cycletime: Cycle time in milliseconds (minimum 20ms)
+            cycletime: Cycle time in milliseconds (minimum 20ms, None for the 200ms default)
             debug: Enable debug mode with verbose logging
             cleanup: Enable automatic cleanup on exit
             auto_prefix: Enable automatic PV prefixing based on device hierarchy
@@ -127,6 +126,9 @@ class RevPiEpics:
             autosave_dir: Directory to save soft PV configuration (e.g. for scaling parameters)
             autosave_name: Name of the generated autosave file
             autosave_period: How frequently (in seconds) the autosave file is recorded
+            sync_cpu: Pin the synchronization thread to this CPU core (Linux only),
+                keeping the process image hot in that core's cache. Other busy
+                threads should then be kept off this core.
             
         Raises:
             RevPiEpicsInitError: If initialization fails
@@ -141,11 +143,12 @@ class RevPiEpics:
                 # Initialize RevPi ModIO without auto-refresh (we handle sync manually)
                 cls._revpi = revpimodio2.RevPiModIO(autorefresh=False, debug=debug)
 
-                # Validate and set cycle time
-                if cycletime is not None:
-                    if cycletime < 20:
-                        raise ValueError(f"Minimum cycle time: 20 ms")
-                    cls._cycle_time_ms = cycletime
+                # Validate and set cycle time (None selects the default)
+                if cycletime is None:
+                    cycletime = cls._DEFAULT_CYCLE_TIME_MS
+                if cycletime < 20:
+                    raise ValueError(f"Minimum cycle time: 20 ms")
+                cls._cycle_time_ms = cycletime
 
                 cls._cleanup = cleanup
                 cls._auto_prefix = auto_prefix
@@ -153,6 +156,7 @@ class RevPiEpics:
                 cls._autosave_dir = autosave_dir
                 cls._autosave_name = autosave_name
                 cls._autosave_period = autosave_period
+                cls._sync_cpu = sync_cpu
 
                 # Configure logging based on debug mode
                 log_level = logging.DEBUG if debug else logging.INFO
@@ -165,22 +169,22 @@ class RevPiEpics:
                 if root_logger.hasHandlers():
                     root_logger.handlers.clear()
                     
-                ch = logging.StreamHandler()
-                ch.setFormatter(ColorLogFormatter(debug=debug))
-                root_logger.addHandler(ch)
+                if cls._log_handler is None:
+                    cls._log_handler = logging.StreamHandler()
+                cls._log_handler.setFormatter(ColorLogFormatter(debug=debug))
+                root_logger.addHandler(cls._log_handler)
 
                 # Initialize PV synchronization thread
                 cls._pv_sync = PVSyncThread(cls)
                 cls._initialized = True
 
-                logger.debug(f"RevPiEpics initialized")
+                logger.debug("RevPiEpics initialized")
 
             except Exception as e:
-                logger.error(f"Initialization error: {e}")
+                logger.error("Initialization error: %s", e)
                 raise RevPiEpicsInitError(f"Initialization failed: {e}") from e
 
     @classmethod
-    @_requires_init
     def builder(
             cls,
             io_name: str,
@@ -205,16 +209,21 @@ class RevPiEpics:
             RecordWrapper instance if successful, None if creation failed
             
         Raises:
+            RevPiEpicsInitError: If init() has not been called
             RevPiEpicsBuilderError: If I/O name not found, already mapped, or no builder available
         """
+        if not cls._initialized:
+            raise RevPiEpicsInitError("RevPiEpics not initialized. Call init() first.")
+
         try:
             # Verify RevPi instance is available
             if not cls._revpi:
                 cls._initialized = False
                 raise RevPiEpicsBuilderError(f"Initialization error")
             
-            # Check if I/O point exists in RevPi configuration
-            if not hasattr(cls._revpi.io, io_name):
+            # Check if I/O point exists in RevPi configuration (single lookup)
+            io_point = getattr(cls._revpi.io, io_name, None)
+            if io_point is None:
                 raise RevPiEpicsBuilderError(f"I/O '{io_name}' not found")
 
             # Check if I/O is already mapped
@@ -225,8 +234,7 @@ class RevPiEpics:
             if pv_name and cls._dictmap.get_by_pv_name(pv_name):
                 raise RevPiEpicsBuilderError(f"PV '{pv_name}' already exists")
 
-            # Get I/O point and its parent device information
-            io_point = getattr(cls._revpi.io, io_name)
+            # Get parent device information
             product_type = io_point._parentdevice._producttype
 
             # Select appropriate builder function based on product type
@@ -245,7 +253,7 @@ class RevPiEpics:
                 init_o = fields.pop('initial_offset', None)
                 
                 if au_p or au_m or au_o or init_m is not None or init_o is not None:
-                    logger.warning(f"Soft scaling parameters are only applicable to Analog endpoints (ignored for '{io_name}')")
+                    logger.warning("Soft scaling parameters are only applicable to Analog endpoints (ignored for '%s')", io_name)
 
             # Use I/O name as PV name if not specified
             if pv_name is None:
@@ -259,8 +267,9 @@ class RevPiEpics:
                 au_o = fields.get('autosave_offset', False)
                 if any([au_base, au_p, au_m, au_o]):
                     logger.warning(
-                        f"Autosave is disabled in RevPiEpics.init(), "
-                        f"autosave parameters for PV '{pv_name}' will be ignored."
+                        "Autosave is disabled in RevPiEpics.init(), "
+                        "autosave parameters for PV '%s' will be ignored.",
+                        pv_name
                     )
 
             # Build with or without automatic prefixing
@@ -288,8 +297,9 @@ class RevPiEpics:
             if mapping:
                 if isinstance(mapping, list):
                     for m in mapping:
-                        cls._dictmap.add(m)
-                    logger.debug(f"Multiple PVs created for I/O '{io_name}' starting with '{pv_name}'")
+                        if not cls._dictmap.add(m):
+                            raise RevPiEpicsBuilderError(f"I/O '{m.io_name}' or PV '{m.pv_name}' already mapped")
+                    logger.debug("Multiple PVs created for I/O '%s' starting with '%s'", io_name, pv_name)
                     
                     record = mapping[0].get_record()
                     if hasattr(mapping[0], 'pv_multiplier') and mapping[0].pv_multiplier is not None:
@@ -298,8 +308,9 @@ class RevPiEpics:
                         object.__setattr__(record, 'offset', mapping[0].pv_offset)
                     return record
                 else:
-                    cls._dictmap.add(mapping)
-                    logger.debug(f"PV '{pv_name}' created for I/O '{io_name}'")
+                    if not cls._dictmap.add(mapping):
+                        raise RevPiEpicsBuilderError(f"I/O '{io_name}' or PV '{pv_name}' already mapped")
+                    logger.debug("PV '%s' created for I/O '%s'", pv_name, io_name)
                     
                     record = mapping.get_record()
                     if hasattr(mapping, 'pv_multiplier') and mapping.pv_multiplier is not None:
@@ -311,9 +322,37 @@ class RevPiEpics:
                 return None
 
         except Exception as e:
-            logger.error(f"PV creation error: {e}")
+            logger.error("PV creation error: %s", e)
             return None
 
+    @classmethod
+    def build_all(
+            cls,
+            spec: Dict[str, Optional[Dict]],
+    ) -> Dict[str, Optional[pythonSoftIoc.RecordWrapper]]:
+        """Create the PVs of several RevPi I/O points in one call.
+
+        Each entry is built exactly as by builder(); a failing entry is logged
+        and reported as None without interrupting the others.
+
+        Args:
+            spec: Mapping of I/O name to the keyword arguments accepted by
+                builder() (pv_name, DRVL, DRVH and record fields), or None
+                to use the defaults
+
+        Returns:
+            Dictionary mapping each I/O name to its RecordWrapper, or None if
+            creation failed for that I/O
+
+        Raises:
+            RevPiEpicsInitError: If init() has not been called
+        """
+        if not cls._initialized:
+            raise RevPiEpicsInitError("RevPiEpics not initialized. Call init() first.")
+
+        build = cls.builder
+        return {io_name: build(io_name, **(cfg or {})) for io_name, cfg in spec.items()}
+
     @classmethod
     def _build_with_prefix(cls, build_func, io_name ,io_point, pv_name, DRVL, DRVH, **fields):
         """Build a PV with automatic prefix based on device hierarchy.
@@ -321,16 +360,25 @@ class RevPiEpics:
         Constructs PV names with automatic prefixes derived from RevPi core and device names.
         """
         rec_names = cast(SimpleRecordNames, builder.GetRecordNames())
-        saved_prefix = rec_names.prefix.copy()
+        # Prefixes are only pushed on top of the current stack, remember its depth
+        saved_depth = len(rec_names.prefix)
 
         try:
-            # Add core name as prefix if available
             if cls._revpi:
-                if cls._revpi.core and cls._revpi.core.name:
-                    rec_names.PushPrefix(cls._revpi.core.name)
-                # Add parent device name as additional prefix if available
-                if io_point._parentdevice and io_point._parentdevice.name:
-                    rec_names.PushPrefix(io_point._parentdevice.name)
+                device = io_point._parentdevice
+                device_name = device.name if device else None
+                segments = cls._prefix_cache.get(device_name)
+                if segments is None:
+                    segments = ()
+                    # Add core name as prefix if available
+                    if cls._revpi.core and cls._revpi.core.name:
+                        segments += (cls._revpi.core.name,)
+                    # Add parent device name as additional prefix if available
+                    if device_name:
+                        segments += (device_name,)
+                    cls._prefix_cache[device_name] = segments
+                # Same effect as one PushPrefix() per segment
+                rec_names.prefix.extend(segments)
 
             return build_func(
                 io_name=io_name,
@@ -339,10 +387,9 @@ class RevPiEpics:
             )
         finally:
             # Always restore original prefix
-            rec_names.prefix = saved_prefix
+            del rec_names.prefix[saved_depth:]
 
     @classmethod
-    @_requires_init
     def start(
             cls,
             interactive: bool = False,
@@ -358,9 +405,19 @@ class RevPiEpics:
             dispatcher: Optional asyncio dispatcher for advanced async operations
             
         Raises:
+            RevPiEpicsInitError: If init() has not been called
             RuntimeError: If synchronization thread fails to initialize
         """
+        if not cls._initialized:
+            raise RevPiEpicsInitError("RevPiEpics not initialized. Call init() first.")
+
         try:
+            # Ensure automatic cleanup on program exit (registered once, also
+            # covers failures below and the exit raised by the IOC shell)
+            if not cls._atexit_registered:
+                atexit.register(cls.stop)
+                cls._atexit_registered = True
+
             # Configure autosave if globally enabled
             if cls._autosave:
                 if cls._autosave_dir:
@@ -369,16 +426,13 @@ class RevPiEpics:
                         name=cls._autosave_name,
                         save_period=cls._autosave_period
                     )
-                    logger.debug(f"Autosave enabled in {cls._autosave_dir}")
+                    logger.debug("Autosave enabled in %s", cls._autosave_dir)
                 else:
                     logger.warning("Autosave is enabled (autosave=True) but 'autosave_dir' is missing! The backup will not start.")
 
             # Load EPICS database with all created PVs
             builder.LoadDatabase()
 
-            # Ensure automatic cleanup on program exit
-            atexit.register(cls.stop)
-
             # Initialize EPICS IOC with optional dispatcher
             if dispatcher:
                 softioc.iocInit(dispatcher)
@@ -399,33 +453,43 @@ class RevPiEpics:
                 softioc.non_interactive_ioc()
 
         except Exception as e:
-            logger.error(f"Startup error: {e}")
+            logger.error("Startup error: %s", e)
             raise
 
-        finally:
-            # Always attempt cleanup on exit
-            cls.stop()
-
     @classmethod
-    @_requires_init
     def stop(cls) -> None:
         """Stop the RevPi-EPICS bridge and cleanup resources.
         
         Stops the synchronization thread, closes RevPi connection, and resets initialization state.
         """
+        # Take ownership of the running resources and reset initialization
+        # state in one critical section, so concurrent calls stop only once
+        with cls._lock:
+            if not cls._initialized:
+                raise RevPiEpicsInitError("RevPiEpics not initialized. Call init() first.")
+            pv_sync, cls._pv_sync = cls._pv_sync, None
+            revpi, cls._revpi = cls._revpi, None
+            cls._initialized = False
+            # Stopped explicitly: do not run again at interpreter exit
+            if cls._atexit_registered:
+                atexit.unregister(cls.stop)
+                cls._atexit_registered = False
+
         logger.debug("Stopping RevPi-EPICS bridge...")
 
         # Stop synchronization thread
-        if cls._pv_sync:
-            cls._pv_sync.stop()
+        if pv_sync:
+            pv_sync.stop()
 
         # Close RevPi connection
-        if cls._revpi:
-            cls._revpi.exit()
-            
-        # Reset initialization state
-        with cls._lock:
-            cls._initialized = False
+        if revpi:
+            revpi.exit()
+
+        # Forget cached device configuration, it may change before the next init()
+        from .aio import clear_param_cache
+        clear_param_cache()
+        clear_io_offset_cache()
+        cls._prefix_cache.clear()
 
 
     @classmethod
@@ -448,7 +512,7 @@ class RevPiEpics:
             raise TypeError("func must be callable")
 
         cls._builder_registry[product_type] = func
-        logger.debug(f"Builder registered for type {product_type}")
+        logger.debug("Builder registered for type %s", product_type)
 
     @classmethod
     def get_mappings(cls) -> Dict[str, IOMap]:
@@ -498,8 +562,9 @@ class RevPiEpics:
 
             # Store function for execution in sync cycle
             cls._custom_functions[func_name] = func
+            cls._custom_functions_snapshot = tuple(cls._custom_functions.items())
 
-        logger.debug(f"Custom function added to synchronization cycle")
+        logger.debug("Custom function added to synchronization cycle")
     
     @classmethod
     def remove_loop_task(cls, func: Callable) -> bool:
@@ -528,10 +593,11 @@ class RevPiEpics:
             if func_name in cls._custom_functions and cls._custom_functions[func_name] is func:
                 # Remove the function from the dictionary
                 removed_func = cls._custom_functions.pop(func_name)
-                logger.debug(f"Loop task '{func_name}' removed from synchronization cycle")
+                cls._custom_functions_snapshot = tuple(cls._custom_functions.items())
+                logger.debug("Loop task '%s' removed from synchronization cycle", func_name)
                 return True
             else:
-                logger.warning(f"Loop task '{func_name}' not found in synchronization cycle")
+                logger.warning("Loop task '%s' not found in synchronization cycle", func_name)
                 return False
     
     @classmethod
@@ -542,9 +608,8 @@ class RevPiEpics:
             Dictionary mapping function names to their callable objects.
             Returns a copy to prevent external modifications.
         """
-        with cls._custom_functions_lock:
-            # Return a copy to prevent external modifications
-            return cls._custom_functions.copy()
+        # Built from the immutable snapshot, no lock needed
+        return dict(cls._custom_functions_snapshot)
 
     @classmethod
     def clear_loop_tasks(cls) -> int:
@@ -556,7 +621,8 @@ class RevPiEpics:
         with cls._custom_functions_lock:
             count = len(cls._custom_functions)
             cls._custom_functions.clear()
-            logger.debug(f"{count} custom function(s) removed")
+            cls._custom_functions_snapshot = ()
+            logger.debug("%s custom function(s) removed", count)
             return count
     
     @classmethod
@@ -566,8 +632,7 @@ class RevPiEpics:
         Returns:
             List of function names currently registered as loop tasks.
         """
-        with cls._custom_functions_lock:
-            return list(cls._custom_functions.keys())
+        return [func_name for func_name, _ in cls._custom_functions_snapshot]
     
 
     @classmethod
@@ -577,10 +642,44 @@ class RevPiEpics:
         Returns:
             Number of loop tasks currently registered.
         """
-        with cls._custom_functions_lock:
-            return len(cls._custom_functions)
+        return len(cls._custom_functions_snapshot)
     
 
+    @classmethod
+    def set_cycle_time(cls, cycletime: int) -> None:
+        """Change the synchronization cycle time.
+
+        Can be called before or after start(); a running synchronization
+        thread picks up the new value on its next cycle.
+
+        Args:
+            cycletime: Cycle time in milliseconds (minimum 20ms)
+
+        Raises:
+            RevPiEpicsInitError: If init() has not been called
+            ValueError: If cycletime is less than 20ms
+        """
+        if cycletime < 20:
+            raise ValueError("Minimum cycle time: 20 ms")
+
+        with cls._lock:
+            if not cls._initialized:
+                raise RevPiEpicsInitError("RevPiEpics not initialized. Call init() first.")
+            cls._cycle_time_ms = cycletime
+            if cls._pv_sync:
+                cls._pv_sync.set_cycle_time(cycletime)
+
+        logger.debug("Cycle time set to %s ms", cycletime)
+
+    @classmethod
+    def get_cycle_time(cls) -> Optional[int]:
+        """Return the synchronization cycle time.
+
+        Returns:
+            Cycle time in milliseconds, None if init() has not been called yet
+        """
+        return cls._cycle_time_ms
+
     @classmethod
     def get_dic_io_map(cls) -> DicIOMap:
         """Return the I/O mapping dictionary instance.
@@ -11,6 +11,7 @@ Functions
 - status_bit_length: returns the bit length of a status word.
 - record_write: callback to write from PV to RevPi output.
 - get_io_offset_value: reads an IO value at a specific offset (low-level).
+- clear_io_offset_cache: forgets the IO objects resolved by offset.
 
 See Also
 --------
@@ -18,17 +19,37 @@ RevPiEpics : Main class managing EPICS-PV bindings.
 aio.builder_aio : Uses these helpers to define EPICS records from RevPi AIO modules.
 """
 
-from typing import cast, Optional
+from typing import Dict, Optional
 from revpimodio2.io import IntIO
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Bit length of every 8-bit value: AIO status registers are one byte wide
+_STATUS_BIT_LUT = tuple(i.bit_length() for i in range(256))
+
+# IO objects already resolved by absolute offset (see get_io_offset_value)
+_IO_OFFSET_CACHE: Dict[int, IntIO] = {}
+
+# RevPiEpics class, resolved on first use: revpiepics.py imports this module
+_bridge_cls = None
+
+def _bridge():
+    """Return the `RevPiEpics` class, importing it only once."""
+    global _bridge_cls
+    if _bridge_cls is None:
+        from .revpiepics import RevPiEpics
+        _bridge_cls = RevPiEpics
+    return _bridge_cls
+
 def status_bit_length(value: int) -> int:
     """
     Converts a status value to an integer representing the number
     of significant bits (used as a basic error code).
 
+    Single-byte values are resolved through a precomputed lookup table;
+    wider values fall back to `int.bit_length()`.
+
     Parameters
     ----------
     value : int
@@ -39,7 +60,10 @@ def status_bit_length(value: int) -> int:
     int
         Number of significant bits.
     """
-    return int(value).bit_length()
+    if 0 <= value < 256:
+        return _STATUS_BIT_LUT[value]
+    # revpimodio2 already delivers int values, no coercion needed
+    return value.bit_length()
 
 def record_write(value: float, pv_name: str) -> None:
     """
@@ -53,23 +77,29 @@ def record_write(value: float, pv_name: str) -> None:
     pv_name : str
         Name of the PV.
     """
-    from .revpiepics import RevPiEpics
-    try:
-        pv_name = pv_name.split(':')[-1]
-        dic_mapping = RevPiEpics.get_dic_io_map()
-        mapping = dic_mapping.get_by_pv_name(pv_name)
-        if mapping is None:
-            raise KeyError(f"PV '{pv_name}' is not associated with any IO.")
-        if not mapping.update_record:
-            mapping.update_record = True
-    except Exception as exc:
-        logger.error("Failed to write using PV %s: %s", pv_name, exc)
+    pv_name = pv_name.rpartition(':')[2]
+    mapping = _bridge().get_dic_io_map().get_by_pv_name(pv_name)
+    if mapping is None:
+        logger.error("Failed to write using PV %s: not associated with any IO", pv_name)
+        return
+    # Applied to the RevPi output by the synchronization thread
+    mapping.update_record = True
+
+def clear_io_offset_cache() -> None:
+    """
+    Drop the IO objects resolved by `get_io_offset_value`.
+
+    Must be called whenever the RevPi configuration may have changed, e.g.
+    when the bridge is stopped before a new `RevPiEpics.init()`.
+    """
+    _IO_OFFSET_CACHE.clear()
 
 def get_io_offset_value(offset: int) -> Optional[int]:
     """Read the value of a RevPi IO by its memory offset.
     
     Returns the value of a RevPi IO by its memory offset.
-    This is a low-level function for direct memory access.
+    This is a low-level function for direct memory access. The IO object
+    found at each offset is cached until `clear_io_offset_cache` is called.
     
     Parameters
     ----------
@@ -79,39 +109,37 @@ def get_io_offset_value(offset: int) -> Optional[int]:
     Returns
     -------
     int or None
-        The value at the offset or None if unavailable.
-        
-    Raises
-    ------
-    TypeError
-        If offset is not an integer.
+        The value at the offset or None if unavailable (including when
+        offset is not a valid integer offset).
     """
-    from .revpiepics import RevPiEpics, RevPiEpicsInitError
-    
-    if not isinstance(offset, int):
-        raise TypeError("offset must be an integer")
-    
     try:
-        # Get RevPi ModIO instance
-        rev_pi = RevPiEpics.get_mod_io()
-        
-        if not rev_pi:
-            raise RevPiEpicsInitError("RevPi ModIO instance not available")
-        elif not rev_pi.io:
-            raise RevPiEpicsInitError("RevPi IO interface not available")
-        
-        # Access IO point at offset
-        io = cast(list, rev_pi.io[offset])
-        io_point = cast(IntIO, io[0])
-        value = io_point.value
-        return value
+        # Only exact ints may hit the cache: 169.0 hashes like 169, and must be
+        # rejected by the IO list lookup below whether 169 is cached or not
+        io_point = _IO_OFFSET_CACHE.get(offset) if type(offset) is int else None
+        if io_point is None:
+            # Get RevPi ModIO instance
+            rev_pi = _bridge().get_mod_io()
+
+            if not rev_pi:
+                logger.error("RevPi not initialized when reading offset %s: RevPi ModIO instance not available", offset)
+                return None
+            elif not rev_pi.io:
+                logger.error("RevPi not initialized when reading offset %s: RevPi IO interface not available", offset)
+                return None
+
+            # Access IO point at offset, resolved once per configuration
+            io_point = rev_pi.io[offset][0]
+            _IO_OFFSET_CACHE[offset] = io_point
+
+        return io_point.value
         
     except IndexError:
-        logger.error("Unable to access RevPi IO at offset %d - offset out of range", offset)
+        logger.error("Unable to access RevPi IO at offset %s - offset out of range", offset)
         return None
-    except RevPiEpicsInitError as e:
-        logger.error("RevPi not initialized when reading offset %d: %s", offset, e)
+    except TypeError:
+        # Non-integer offsets are rejected by the IO list lookup itself
+        logger.error("Unable to access RevPi IO at offset %r - offset must be an integer", offset)
         return None
     except Exception as e:
-        logger.error("Unexpected error reading offset %d: %s", offset, e)
+        logger.error("Unexpected error reading offset %r: %s", offset, e)
         return None